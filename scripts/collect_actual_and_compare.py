@@ -9,217 +9,427 @@ the forecast adds over simply assuming "tomorrow = today".
 Also rebuilds the summary JSON used by the frontend.
 """
 
-import json
-import math
+import gzip
+import hashlib
 import os
 import sys
-import time
 from datetime import datetime, timezone, timedelta
 
-import requests
+import numpy as np
+import orjson
 
-from config import (
-    NSW_REGIONS, FORECAST_API_URL, DAILY_VARIABLES, HOURLY_VARIABLES, THRESHOLDS
-)
+from config import NSW_REGIONS, REGION_LAT, REGION_LON, THRESHOLDS, SUMMARY_MAX_DAYS
+from open_meteo import make_session, fetch_regions, daily_mean_humidity
 
 AEST = timezone(timedelta(hours=10))
 METRICS = ["high_temp", "low_temp", "wind_speed", "humidity", "rain"]
 
+# (metric, near, wide, unit) in METRICS order, so compute_accuracy doesn't
+# look thresholds up per metric on every call
+METRIC_THRESHOLDS = tuple(
+    (m, THRESHOLDS[m]["near"], THRESHOLDS[m]["wide"], THRESHOLDS[m]["unit"]) for m in METRICS
+)
+NEAR_LIMITS = np.array([THRESHOLDS[m]["near"] for m in METRICS], dtype=float)
+WIDE_LIMITS = np.array([THRESHOLDS[m]["wide"] for m in METRICS], dtype=float)
 
-def fetch_with_retry(url, params, retries=3, base_timeout=30):
-    """Fetch URL with exponential backoff retries on timeout/connection errors."""
-    for attempt in range(retries):
-        try:
-            resp = requests.get(url, params=params, timeout=base_timeout)
-            resp.raise_for_status()
-            return resp
-        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
-            if attempt == retries - 1:
-                raise
-            wait = 2 ** (attempt + 1)
-            print(f"    Retry {attempt + 1}/{retries - 1} after {wait}s ({e})")
-            time.sleep(wait)
-
+# Position of each region in NSW_REGIONS, used to keep saved files in config order
+REGION_ORDER = {r["name"]: i for i, r in enumerate(NSW_REGIONS)}
 
-def fetch_actual(region, target_date):
-    """Fetch actual weather for a completed day using Open-Meteo forecast API with past_days.
+# Archive of summary entries, one compact JSON object per line in date order
+HISTORY_FILENAME = "history.jsonl.gz"
 
-    We use the forecast API (not historical archive) because the archive API
-    has a multi-day delay. The forecast API's past_days data uses data
-    assimilation from weather stations, giving us near-observed values for
-    recent days.
-    """
-    params = {
-        "latitude": region["lat"],
-        "longitude": region["lon"],
-        "daily": ",".join(DAILY_VARIABLES),
-        "hourly": ",".join(HOURLY_VARIABLES),
-        "timezone": "Australia/Sydney",
-        "start_date": target_date,
-        "end_date": target_date,
-        "past_days": 2,
-        "wind_speed_unit": "kmh",
-        "precipitation_unit": "mm",
-        "temperature_unit": "celsius",
-    }
+# Every history line starts with its date, since summary_entry puts it first
+HISTORY_DATE_PREFIX = b'{"date":"'
 
-    resp = fetch_with_retry(FORECAST_API_URL, params)
-    data = resp.json()
 
-    daily = data.get("daily", {})
-    hourly = data.get("hourly", {})
+def parse_actual(region, data, target_date):
+    """Extract the actual weather for target_date from one region's Open-Meteo payload."""
+    daily = data.daily
 
     # Find the index for our target date in the daily arrays
-    daily_dates = daily.get("time", [])
     try:
-        idx = daily_dates.index(target_date)
+        idx = daily.time.index(target_date)
     except ValueError:
-        raise ValueError(f"Target date {target_date} not found in API response dates: {daily_dates}")
-
-    # For hourly humidity, extract only the 24 hours for the target date
-    hourly_times = hourly.get("time", [])
-    humidity_values = hourly.get("relative_humidity_2m", [])
-    day_humidity = []
-    for i, t in enumerate(hourly_times):
-        if t.startswith(target_date) and i < len(humidity_values) and humidity_values[i] is not None:
-            day_humidity.append(humidity_values[i])
-
-    avg_humidity = round(sum(day_humidity) / len(day_humidity), 1) if day_humidity else None
+        raise ValueError(f"Target date {target_date} not found in API response dates: {daily.time}")
 
     return {
         "region": region["name"],
         "lat": region["lat"],
         "lon": region["lon"],
         "date": target_date,
-        "high_temp": daily.get("temperature_2m_max", [None])[idx],
-        "low_temp": daily.get("temperature_2m_min", [None])[idx],
-        "wind_speed": daily.get("wind_speed_10m_max", [None])[idx],
-        "humidity": avg_humidity,
-        "rain": daily.get("precipitation_sum", [None])[idx],
+        "high_temp": daily.temperature_2m_max[idx],
+        "low_temp": daily.temperature_2m_min[idx],
+        "wind_speed": daily.wind_speed_10m_max[idx],
+        "humidity": daily_mean_humidity(data.hourly, target_date),
+        "rain": daily.precipitation_sum[idx],
     }
 
 
-def compute_accuracy(forecast_regions, actual_regions):
-    """Compare forecast vs actual for each region and compute accuracy metrics."""
-    # Index actuals by region name for easy lookup
-    actual_by_name = {a["region"]: a for a in actual_regions}
+def fetch_actuals(session, target_dates, region_idx=None):
+    """Fetch actual weather for completed days using Open-Meteo forecast API with past_days.
 
-    comparisons = []
-    diffs = {m: [] for m in METRICS}
-
-    for fc in forecast_regions:
-        name = fc["region"]
-        act = actual_by_name.get(name)
-        if not act:
-            continue
+    We use the forecast API (not historical archive) because the archive API
+    has a multi-day delay. The forecast API's past_days data uses data
+    assimilation from weather stations, giving us near-observed values for
+    recent days.
 
-        region_comp = {"region": name, "metrics": {}}
+    All dates are covered by a single request spanning their range, for every
+    region or only those at the `region_idx` positions of NSW_REGIONS. Returns
+    a dict mapping each date to its list of region actuals.
+    """
+    if region_idx is None:
+        region_idx = np.arange(len(NSW_REGIONS))
+    # Region rows and coordinates come from the same positions, so they stay aligned
+    regions = [NSW_REGIONS[i] for i in region_idx]
+    lats, lons = REGION_LAT[region_idx], REGION_LON[region_idx]
 
-        for metric in METRICS:
-            fc_val = fc.get(metric)
-            act_val = act.get(metric)
-
-            if fc_val is None or act_val is None:
-                region_comp["metrics"][metric] = {
-                    "forecast": fc_val,
-                    "actual": act_val,
-                    "diff": None,
-                }
+    try:
+        payloads = fetch_regions(session, min(target_dates), max(target_dates), lats, lons, past_days=2)
+    except Exception as e:
+        print(f"  FAIL: batch request for {len(regions)} regions - {e}", file=sys.stderr)
+        return {target_date: [] for target_date in target_dates}
+
+    actuals_by_date = {}
+    for target_date in target_dates:
+        actuals = []
+        for region, data in zip(regions, payloads):
+            try:
+                actual = parse_actual(region, data, target_date)
+            except Exception as e:
+                print(f"  FAIL: {region['name']} - {e}", file=sys.stderr)
                 continue
+            actuals.append(actual)
+            print(f"  OK: {target_date} {region['name']} - High: {actual['high_temp']}°C, "
+                  f"Low: {actual['low_temp']}°C, Rain: {actual['rain']}mm")
+        actuals_by_date[target_date] = actuals
+    return actuals_by_date
 
-            diff = round(abs(fc_val - act_val), 2)
-            diffs[metric].append(diff)
-            region_comp["metrics"][metric] = {
-                "forecast": fc_val,
-                "actual": act_val,
-                "diff": diff,
-            }
 
-        comparisons.append(region_comp)
+def load_actuals(actuals_path):
+    """Load one day's saved region actuals, or an empty list if none are saved."""
+    if not os.path.exists(actuals_path):
+        return []
+    with open(actuals_path, "rb") as f:
+        return orjson.loads(f.read()).get("regions", [])
 
-    # Compute summary statistics
-    summary = {}
-    for metric in METRICS:
-        vals = diffs[metric]
-        if not vals:
-            summary[metric] = None
-            continue
 
-        thresholds = THRESHOLDS[metric]
-        n = len(vals)
+def save_actuals(actuals_path, target_date, actuals):
+    """Write one day's region actuals to data/actuals/."""
+    output = {
+        "date": target_date,
+        "collected_at": datetime.now(timezone.utc).isoformat(),
+        "type": "actual",
+        "region_count": len(actuals),
+        "regions": actuals,
+    }
+    with open(actuals_path, "wb") as f:
+        f.write(orjson.dumps(output))
+
+
+def reduce_metrics(diffs, near_limits, wide_limits):
+    """Reduce a rows x metrics matrix of absolute diffs (NaN = missing) along
+    the row axis to per-metric (n, exact, near, wide, mean, std) vectors.
+
+    Rows are regions, so a multi-day window is just a taller matrix.
+    """
+    present = ~np.isnan(diffs)
+    n = present.sum(axis=0)
+    # NaN compares False, so missing values drop out of the counts
+    exact = (diffs <= 0.5).sum(axis=0)  # within rounding
+    near = (diffs <= near_limits).sum(axis=0)
+    wide = (diffs <= wide_limits).sum(axis=0)
+
+    # Columns with no data at all are left as NaN
+    mean = np.full(diffs.shape[1], np.nan)
+    std = np.full(diffs.shape[1], np.nan)
+    has_data = n > 0
+    mean[has_data] = np.nanmean(diffs[:, has_data], axis=0)
+    std[has_data] = np.nanstd(diffs[:, has_data], axis=0)
+    return n, exact, near, wide, mean, std
+
+
+def tabulate_regions(regions):
+    """Index regions by name and lay their metric values out as a
+    regions x metrics matrix (missing values stay NaN)."""
+    name_to_idx = {}
+    values = np.full((len(regions), len(METRICS)), np.nan)
+    for i, r in enumerate(regions):
+        name_to_idx[r["region"]] = i
+        for j, metric in enumerate(METRICS):
+            v = r.get(metric)
+            if v is not None:
+                values[i, j] = v
+    return name_to_idx, values
+
+
+def compute_accuracy(forecast_regions, actual_regions, actual_table=None):
+    """Compare forecast vs actual for each region and compute accuracy metrics.
+
+    `actual_table` is tabulate_regions(actual_regions); pass it in to reuse it
+    across several comparisons against the same actuals.
+    """
+    if actual_table is None:
+        actual_table = tabulate_regions(actual_regions)
+    name_to_idx, actual_values = actual_table
+
+    # Row of each forecast region's actual, dropping regions with no actual
+    fc_rows = [fc for fc in forecast_regions if fc["region"] in name_to_idx]
+    act_idx = [name_to_idx[fc["region"]] for fc in fc_rows]
+    pairs = [(fc, actual_regions[i]) for fc, i in zip(fc_rows, act_idx)]
 
-        exact_count = sum(1 for v in vals if v <= 0.5)  # within rounding
-        near_count = sum(1 for v in vals if v <= thresholds["near"])
-        wide_count = sum(1 for v in vals if v <= thresholds["wide"])
+    # Regions x metrics matrices so each statistic below is a single array
+    # operation rather than a Python loop
+    _, fc_vals = tabulate_regions(fc_rows)
+    act_vals = actual_values[np.array(act_idx, dtype=np.intp)]
+    diffs = np.round(np.abs(fc_vals - act_vals), 2)
 
-        mean_diff = sum(vals) / n
-        std_dev = math.sqrt(sum((v - mean_diff) ** 2 for v in vals) / n) if n > 1 else 0
+    # Convert once so the per-region loop works on plain Python values
+    # instead of indexing NumPy scalars element by element
+    diff_rows = np.where(np.isnan(diffs), None, diffs).tolist()
+
+    comparisons = []
+    for (fc, act), diff_row in zip(pairs, diff_rows):
+        fc_get = fc.get
+        act_get = act.get
+        metrics = {
+            metric: {"forecast": fc_get(metric), "actual": act_get(metric), "diff": diff}
+            for metric, diff in zip(METRICS, diff_row)
+        }
+        comparisons.append({"region": fc["region"], "metrics": metrics})
+
+    # Compute summary statistics for all metrics at once. Values stay at full
+    # precision (including the inputs to the overall scores) and are rounded
+    # only where they are written into the result.
+    n, exact, near, wide, mean, std = reduce_metrics(diffs, NEAR_LIMITS, WIDE_LIMITS)
+    has_data = n > 0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        exact_pct, near_pct, wide_pct = np.stack([exact, near, wide]) / n * 100
+
+    summary = {}
+    stats = zip(METRIC_THRESHOLDS, n.tolist(), exact_pct.tolist(), near_pct.tolist(),
+                wide_pct.tolist(), mean.tolist(), std.tolist())
+    for (metric, near_t, wide_t, unit), count, exact_p, near_p, wide_p, mean_diff, std_dev in stats:
+        if not count:
+            summary[metric] = None
+            continue
 
         summary[metric] = {
-            "exact_pct": round(exact_count / n * 100, 1),
-            "near_pct": round(near_count / n * 100, 1),
-            "near_threshold": thresholds["near"],
-            "wide_pct": round(wide_count / n * 100, 1),
-            "wide_threshold": thresholds["wide"],
+            "exact_pct": round(exact_p, 1),
+            "near_pct": round(near_p, 1),
+            "near_threshold": near_t,
+            "wide_pct": round(wide_p, 1),
+            "wide_threshold": wide_t,
             "mean_diff": round(mean_diff, 2),
             "std_dev": round(std_dev, 2),
-            "unit": thresholds["unit"],
-            "sample_size": n,
+            "unit": unit,
+            "sample_size": count,
         }
 
     # Overall score: average of the "wide" percentage across all metrics (higher = better)
-    valid_summaries = [s for s in summary.values() if s is not None]
-    overall_score = round(
-        sum(s["wide_pct"] for s in valid_summaries) / len(valid_summaries), 1
-    ) if valid_summaries else 0
+    overall_score = float(wide_pct[has_data].mean()) if has_data.any() else 0
 
     # Weighted overall score using std_dev (lower std_dev = more consistent = bonus)
-    avg_std = sum(s["std_dev"] for s in valid_summaries) / len(valid_summaries) if valid_summaries else 0
+    avg_std = float(std[has_data].mean()) if has_data.any() else 0
 
     return {
         "summary": summary,
-        "overall_score": overall_score,
+        "overall_score": round(overall_score, 1),
         "avg_std_dev": round(avg_std, 2),
         "comparisons": comparisons,
     }
 
 
-def rebuild_summary(results_dir):
-    """Rebuild the summary.json used by the frontend from all result files."""
-    all_results = []
+def summary_entry(result):
+    """Project a day's result onto the compact entry stored in summary.json."""
+    entry = {
+        "date": result["date"],
+        "overall_score": result["accuracy"]["overall_score"],
+        "avg_std_dev": result["accuracy"]["avg_std_dev"],
+        "summary": result["accuracy"]["summary"],
+    }
+    if "baseline_accuracy" in result:
+        entry["baseline_score"] = result["baseline_accuracy"]["overall_score"]
+        entry["baseline_summary"] = result["baseline_accuracy"]["summary"]
+        entry["forecast_skill"] = result.get("forecast_skill", 0)
+    return entry
 
-    for filename in sorted(os.listdir(results_dir)):
-        if not filename.endswith(".json") or filename == "summary.json":
-            continue
-        filepath = os.path.join(results_dir, filename)
-        with open(filepath) as f:
-            result = json.load(f)
-        entry = {
-            "date": result["date"],
-            "overall_score": result["accuracy"]["overall_score"],
-            "avg_std_dev": result["accuracy"]["avg_std_dev"],
-            "summary": result["accuracy"]["summary"],
-        }
-        if "baseline_accuracy" in result:
-            entry["baseline_score"] = result["baseline_accuracy"]["overall_score"]
-            entry["baseline_summary"] = result["baseline_accuracy"]["summary"]
-            entry["forecast_skill"] = result.get("forecast_skill", 0)
-        all_results.append(entry)
 
-    # Sort by date descending (most recent first)
-    all_results.sort(key=lambda x: x["date"], reverse=True)
+def most_recent(by_date, n):
+    """Keep only the n most recent entries of a date-keyed dict."""
+    return dict(sorted(by_date.items(), reverse=True)[:n])
+
+
+def write_summary(results_dir, entries, total_days, fingerprint):
+    """Write summary.json with the SUMMARY_MAX_DAYS most recent entries, newest
+    first, recording the results fingerprint it was built against."""
+    entries.sort(key=lambda x: x["date"], reverse=True)
 
     summary = {
         "last_updated": datetime.now(timezone.utc).isoformat(),
-        "total_days": len(all_results),
-        "results": all_results,
+        "total_days": total_days,
+        "results_fingerprint": fingerprint,
+        "results": entries[:SUMMARY_MAX_DAYS],
     }
 
+    # Indented, unlike the machine-read data files, since people inspect it
     summary_path = os.path.join(results_dir, "summary.json")
-    with open(summary_path, "w") as f:
-        json.dump(summary, f, indent=2)
+    with open(summary_path, "wb") as f:
+        f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
+
+
+def history_line_date(line):
+    """Read the date of a raw history line without parsing the whole entry."""
+    if line.startswith(HISTORY_DATE_PREFIX):
+        start = len(HISTORY_DATE_PREFIX)
+        return line[start:start + 10].decode()
+    return orjson.loads(line)["date"]
+
+
+def update_history(results_dir, entry):
+    """Add one summary entry to the history archive, replacing any entry
+    already stored for the same date, and return the number of days stored.
+
+    Entries stay in date order. The archive is recompressed as one gzip
+    stream, since appending in place would add a separate gzip member per run
+    and lose most of the compression. Old lines are copied through as raw
+    bytes; only their dates are read.
+    """
+    history_path = os.path.join(results_dir, HISTORY_FILENAME)
+    tmp_path = history_path + ".tmp"
+    new_line = orjson.dumps(entry) + b"\n"
+    dates = {entry["date"]}
+    written = False
+    with gzip.open(tmp_path, "wb") as out:
+        if os.path.exists(history_path):
+            with gzip.open(history_path, "rb") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    date = history_line_date(line)
+                    if date == entry["date"]:
+                        continue
+                    if not written and date > entry["date"]:
+                        out.write(new_line)
+                        written = True
+                    dates.add(date)
+                    out.write(line if line.endswith(b"\n") else line + b"\n")
+        if not written:
+            out.write(new_line)
+    os.replace(tmp_path, history_path)
+    return len(dates)
+
+
+def iter_history(results_dir):
+    """Stream summary entries from the history archive one line at a time."""
+    history_path = os.path.join(results_dir, HISTORY_FILENAME)
+    with gzip.open(history_path, "rb") as f:
+        for line in f:
+            if line.strip():
+                yield orjson.loads(line)
+
+
+def result_files(results_dir):
+    """List the per-day result files in results_dir, oldest date first."""
+    with os.scandir(results_dir) as it:
+        entries = [
+            e for e in it
+            if e.name.endswith(".json") and e.name != "summary.json" and e.is_file()
+        ]
+    entries.sort(key=lambda e: e.name)
+    return entries
+
+
+def result_sizes(results_dir):
+    """Map each per-day result filename to its size in bytes.
+
+    Only the directory listing is read, not the files.
+    """
+    return {e.name: e.stat().st_size for e in result_files(results_dir)}
+
+
+def results_fingerprint(sizes):
+    """Hash a result_sizes mapping.
+
+    Unlike mtimes, names and sizes survive a fresh git checkout, so an added,
+    deleted or edited result file shows up as a changed fingerprint.
+    """
+    digest = hashlib.sha1()
+    for name, size in sorted(sizes.items()):
+        digest.update(f"{name}:{size}\n".encode())
+    return digest.hexdigest()
+
 
-    print(f"Rebuilt summary.json with {len(all_results)} days of data")
+def rebuild_history(results_dir):
+    """Regenerate the history archive from all per-day result files."""
+    history_path = os.path.join(results_dir, HISTORY_FILENAME)
+    entries = result_files(results_dir)
+
+    with gzip.open(history_path, "wb") as out:
+        for dir_entry in entries:
+            with open(dir_entry.path, "rb") as f:
+                result = orjson.loads(f.read())
+            out.write(orjson.dumps(summary_entry(result)) + b"\n")
+
+    print(f"Rebuilt {HISTORY_FILENAME} from {len(entries)} result files")
+
+
+def rebuild_summary(results_dir, fingerprint):
+    """Rebuild the summary.json used by the frontend by streaming the history archive.
+
+    Only the most recent SUMMARY_MAX_DAYS entries are held in memory, so the
+    cost stays flat as history grows. Later lines win for a repeated date.
+    """
+    recent = {}
+    dates = set()
+
+    for entry in iter_history(results_dir):
+        dates.add(entry["date"])
+        recent[entry["date"]] = entry
+        if len(recent) > 2 * SUMMARY_MAX_DAYS:
+            recent = most_recent(recent, SUMMARY_MAX_DAYS)
+
+    write_summary(results_dir, list(recent.values()), len(dates), fingerprint)
+    print(f"Rebuilt summary.json with {len(dates)} days of data")
+
+
+def summary_is_stale(results_dir, fingerprint):
+    """Check whether summary.json or the history archive is missing, or the
+    result files have changed since the summary was last written.
+
+    summary.json records the results fingerprint as of its last write, which
+    includes that run's own result file. `fingerprint` must describe the
+    result files before the current run saves its own, so a rerun for the
+    same date still matches.
+    """
+    summary_path = os.path.join(results_dir, "summary.json")
+    history_path = os.path.join(results_dir, HISTORY_FILENAME)
+    if not os.path.exists(summary_path) or not os.path.exists(history_path):
+        return True
+    try:
+        with open(summary_path, "rb") as f:
+            recorded = orjson.loads(f.read()).get("results_fingerprint")
+    except (OSError, orjson.JSONDecodeError, AttributeError):
+        return True
+    return recorded != fingerprint
+
+
+def update_summary(results_dir, entry, total_days, fingerprint):
+    """Merge one day's entry into the existing summary.json without reading
+    the history. total_days is the day count from the updated history. Falls
+    back to a full rebuild if the summary can't be read."""
+    summary_path = os.path.join(results_dir, "summary.json")
+    try:
+        with open(summary_path, "rb") as f:
+            summary = orjson.loads(f.read())
+        by_date = {r["date"]: r for r in summary["results"]}
+    except (OSError, orjson.JSONDecodeError, KeyError, TypeError) as e:
+        print(f"WARNING: Could not read {summary_path} ({e}), rebuilding")
+        rebuild_summary(results_dir, fingerprint)
+        return
+
+    by_date[entry["date"]] = entry
+    write_summary(results_dir, list(by_date.values()), total_days, fingerprint)
+    print(f"Updated summary.json with {total_days} days of data")
 
 
 def main():
@@ -240,84 +450,61 @@ def main():
         print("This is expected on the first run. Skipping comparison.")
         return 0
 
-    with open(forecast_path) as f:
-        forecast_data = json.load(f)
+    with open(forecast_path, "rb") as f:
+        forecast_data = orjson.loads(f.read())
 
-    # Collect actual weather for yesterday
-    print(f"\nCollecting actual weather for {yesterday}...")
-    actuals = []
-    for region in NSW_REGIONS:
-        try:
-            actual = fetch_actual(region, yesterday)
-            actuals.append(actual)
-            print(f"  OK: {region['name']} - High: {actual['high_temp']}°C, "
-                  f"Low: {actual['low_temp']}°C, Rain: {actual['rain']}mm")
-        except Exception as e:
-            print(f"  FAIL: {region['name']} - {e}", file=sys.stderr)
-        time.sleep(0.5)
-
-    # Save actuals
+    # Collect actual weather for yesterday, plus day-before-yesterday actuals
+    # for the persistence baseline
+    # "Persistence forecast" = assume yesterday's weather repeats today
+    day_before = (now_aest - timedelta(days=2)).strftime("%Y-%m-%d")
+    dates = [day_before, yesterday]
     actuals_dir = os.path.join(repo_root, "data", "actuals")
     os.makedirs(actuals_dir, exist_ok=True)
-    actuals_output = {
-        "date": yesterday,
-        "collected_at": datetime.now(timezone.utc).isoformat(),
-        "type": "actual",
-        "region_count": len(actuals),
-        "regions": actuals,
-    }
-    actuals_path = os.path.join(actuals_dir, f"{yesterday}.json")
-    with open(actuals_path, "w") as f:
-        json.dump(actuals_output, f, indent=2)
-    print(f"\nSaved {len(actuals)} actuals to {actuals_path}")
+    actuals_paths = {d: os.path.join(actuals_dir, f"{d}.json") for d in dates}
+
+    # Actuals for a completed day don't change, so reuse whatever is already
+    # saved (reruns, earlier runs) and only fetch the missing (region, day) pairs
+    print()
+    actuals_by_date = {}
+    missing_idx = {}
+    for d in dates:
+        actuals_by_date[d] = load_actuals(actuals_paths[d])
+        have = {a["region"] for a in actuals_by_date[d]}
+        missing_idx[d] = [i for i, r in enumerate(NSW_REGIONS) if r["name"] not in have]
+        if actuals_by_date[d]:
+            print(f"Loaded {len(actuals_by_date[d])} saved actuals for {d} from {actuals_paths[d]}")
+
+    fetch_dates = [d for d in dates if missing_idx[d]]
+    if fetch_dates:
+        region_idx = sorted(set().union(*(missing_idx[d] for d in fetch_dates)))
+        print(f"\nCollecting actual weather for {len(region_idx)} regions on {', '.join(fetch_dates)}...")
+        session = make_session()
+        fetched = fetch_actuals(session, fetch_dates, region_idx)
+
+        for d in fetch_dates:
+            wanted = {NSW_REGIONS[i]["name"] for i in missing_idx[d]}
+            new_actuals = [a for a in fetched[d] if a["region"] in wanted]
+            if not new_actuals and os.path.exists(actuals_paths[d]):
+                continue
+            merged = actuals_by_date[d] + new_actuals
+            merged.sort(key=lambda a: REGION_ORDER[a["region"]])
+            actuals_by_date[d] = merged
+            save_actuals(actuals_paths[d], d, merged)
+            print(f"Saved {len(merged)} actuals to {actuals_paths[d]}")
 
-    # Collect day-before-yesterday actuals for persistence baseline
-    # "Persistence forecast" = assume yesterday's weather repeats today
-    day_before = (now_aest - timedelta(days=2)).strftime("%Y-%m-%d")
-    day_before_actuals_path = os.path.join(actuals_dir, f"{day_before}.json")
-    day_before_actuals = None
-
-    # Try loading from previously saved file first
-    if os.path.exists(day_before_actuals_path):
-        print(f"\nLoading day-before-yesterday actuals from {day_before_actuals_path}")
-        with open(day_before_actuals_path) as f:
-            day_before_data = json.load(f)
-        day_before_actuals = day_before_data.get("regions", [])
-    else:
-        # Fetch from API if not available locally
-        print(f"\nCollecting day-before-yesterday actuals ({day_before}) for baseline...")
-        day_before_actuals = []
-        for region in NSW_REGIONS:
-            try:
-                actual = fetch_actual(region, day_before)
-                day_before_actuals.append(actual)
-                print(f"  OK: {region['name']} - High: {actual['high_temp']}°C")
-            except Exception as e:
-                print(f"  FAIL: {region['name']} - {e}", file=sys.stderr)
-            time.sleep(0.5)
-
-        # Save the day-before actuals too
-        if day_before_actuals:
-            day_before_output = {
-                "date": day_before,
-                "collected_at": datetime.now(timezone.utc).isoformat(),
-                "type": "actual",
-                "region_count": len(day_before_actuals),
-                "regions": day_before_actuals,
-            }
-            with open(day_before_actuals_path, "w") as f:
-                json.dump(day_before_output, f, indent=2)
-            print(f"Saved {len(day_before_actuals)} day-before actuals to {day_before_actuals_path}")
+    actuals = actuals_by_date[yesterday]
+    day_before_actuals = actuals_by_date[day_before]
 
     # Compute forecast accuracy
     print("\nComputing forecast accuracy...")
-    accuracy = compute_accuracy(forecast_data["regions"], actuals)
+    actual_table = tabulate_regions(actuals)
+    accuracy = compute_accuracy(forecast_data["regions"], actuals, actual_table)
 
     # Compute persistence baseline accuracy (day-before-yesterday actuals vs yesterday actuals)
     baseline_accuracy = None
     if day_before_actuals:
         print("Computing persistence baseline accuracy (previous day actuals as prediction)...")
-        baseline_accuracy = compute_accuracy(day_before_actuals, actuals)
+        baseline_accuracy = compute_accuracy(day_before_actuals, actuals, actual_table)
 
     # Print forecast summary
     labels = {
@@ -370,6 +557,10 @@ def main():
     # Save result
     results_dir = os.path.join(repo_root, "data", "results")
     os.makedirs(results_dir, exist_ok=True)
+    # One listing of the result files serves both the staleness check and the
+    # fingerprint recorded in the new summary
+    sizes = result_sizes(results_dir)
+    summary_stale = summary_is_stale(results_dir, results_fingerprint(sizes))
     result = {
         "date": yesterday,
         "processed_at": datetime.now(timezone.utc).isoformat(),
@@ -381,13 +572,23 @@ def main():
         result["forecast_skill"] = round(
             accuracy["overall_score"] - baseline_accuracy["overall_score"], 1
         )
+    result_bytes = orjson.dumps(result)
     result_path = os.path.join(results_dir, f"{yesterday}.json")
-    with open(result_path, "w") as f:
-        json.dump(result, f, indent=2)
+    with open(result_path, "wb") as f:
+        f.write(result_bytes)
     print(f"\nSaved results to {result_path}")
-
-    # Rebuild summary for frontend
-    rebuild_summary(results_dir)
+    sizes[f"{yesterday}.json"] = len(result_bytes)
+    fingerprint = results_fingerprint(sizes)
+
+    # Update the history archive and the summary for the frontend, rescanning
+    # every result file only when either is missing or out of date
+    if summary_stale:
+        rebuild_history(results_dir)
+        rebuild_summary(results_dir, fingerprint)
+    else:
+        entry = summary_entry(result)
+        total_days = update_history(results_dir, entry)
+        update_summary(results_dir, entry, total_days, fingerprint)
 
     return 0
 
@@ -5,69 +5,32 @@ Runs early morning AEST to capture the day's forecast BEFORE the day unfolds.
 Saves forecast data to data/forecasts/YYYY-MM-DD.json
 """
 
-import json
 import os
 import sys
-import time
 from datetime import datetime, timezone, timedelta
 
-import requests
+import orjson
 
-from config import NSW_REGIONS, FORECAST_API_URL, DAILY_VARIABLES, HOURLY_VARIABLES
+from config import NSW_REGIONS
+from open_meteo import make_session, fetch_regions, daily_mean_humidity
 
 AEST = timezone(timedelta(hours=10))
 
 
-def fetch_with_retry(url, params, retries=3, base_timeout=30):
-    """Fetch URL with exponential backoff retries on timeout/connection errors."""
-    for attempt in range(retries):
-        try:
-            resp = requests.get(url, params=params, timeout=base_timeout)
-            resp.raise_for_status()
-            return resp
-        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
-            if attempt == retries - 1:
-                raise
-            wait = 2 ** (attempt + 1)
-            print(f"    Retry {attempt + 1}/{retries - 1} after {wait}s ({e})")
-            time.sleep(wait)
-
-
-def fetch_forecast(region, target_date):
-    """Fetch today's forecast for a single region from Open-Meteo."""
-    params = {
-        "latitude": region["lat"],
-        "longitude": region["lon"],
-        "daily": ",".join(DAILY_VARIABLES),
-        "hourly": ",".join(HOURLY_VARIABLES),
-        "timezone": "Australia/Sydney",
-        "start_date": target_date,
-        "end_date": target_date,
-        "wind_speed_unit": "kmh",
-        "precipitation_unit": "mm",
-        "temperature_unit": "celsius",
-    }
-
-    resp = fetch_with_retry(FORECAST_API_URL, params)
-    data = resp.json()
-
-    daily = data.get("daily", {})
-    hourly = data.get("hourly", {})
-
-    # Calculate daily average humidity from hourly data
-    humidity_values = hourly.get("relative_humidity_2m", [])
-    avg_humidity = round(sum(humidity_values) / len(humidity_values), 1) if humidity_values else None
+def parse_forecast(region, data, target_date):
+    """Extract today's forecast for a single region from its Open-Meteo payload."""
+    daily = data.daily
 
     return {
         "region": region["name"],
         "lat": region["lat"],
         "lon": region["lon"],
         "date": target_date,
-        "high_temp": daily.get("temperature_2m_max", [None])[0],
-        "low_temp": daily.get("temperature_2m_min", [None])[0],
-        "wind_speed": daily.get("wind_speed_10m_max", [None])[0],
-        "humidity": avg_humidity,
-        "rain": daily.get("precipitation_sum", [None])[0],
+        "high_temp": daily.temperature_2m_max[0],
+        "low_temp": daily.temperature_2m_min[0],
+        "wind_speed": daily.wind_speed_10m_max[0],
+        "humidity": daily_mean_humidity(data.hourly, target_date),
+        "rain": daily.precipitation_sum[0],
     }
 
 
@@ -79,19 +42,23 @@ def main():
     print(f"Collecting forecasts for {target_date} (AEST)")
     print(f"Current time: {now_aest.isoformat()}")
 
+    session = make_session()
+    try:
+        payloads = fetch_regions(session, target_date, target_date)
+    except Exception as e:
+        print(f"  FAIL: batch request for {len(NSW_REGIONS)} regions - {e}", file=sys.stderr)
+        payloads = []
+
     forecasts = []
-    for region in NSW_REGIONS:
+    for region, data in zip(NSW_REGIONS, payloads):
         try:
-            forecast = fetch_forecast(region, target_date)
+            forecast = parse_forecast(region, data, target_date)
             forecasts.append(forecast)
             print(f"  OK: {region['name']} - High: {forecast['high_temp']}°C, "
                   f"Low: {forecast['low_temp']}°C, Rain: {forecast['rain']}mm")
         except Exception as e:
             print(f"  FAIL: {region['name']} - {e}", file=sys.stderr)
 
-        # Rate limiting - be kind to the free API
-        time.sleep(0.5)
-
     output = {
         "date": target_date,
         "collected_at": datetime.now(timezone.utc).isoformat(),
@@ -107,8 +74,8 @@ def main():
     os.makedirs(output_dir, exist_ok=True)
 
     output_path = os.path.join(output_dir, f"{target_date}.json")
-    with open(output_path, "w") as f:
-        json.dump(output, f, indent=2)
+    with open(output_path, "wb") as f:
+        f.write(orjson.dumps(output))
 
     total = len(NSW_REGIONS)
     collected = len(forecasts)
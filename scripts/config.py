@@ -3,6 +3,8 @@ Configuration for NSW Weather Accuracy Tracker.
 Defines all NSW regions with their coordinates for Open-Meteo API calls.
 """
 
+import numpy as np
+
 # NSW regions with representative city coordinates (latitude, longitude)
 NSW_REGIONS = [
     {"name": "Sydney", "lat": -33.87, "lon": 151.21},
@@ -27,6 +29,11 @@ NSW_REGIONS = [
     {"name": "Moree", "lat": -29.46, "lon": 149.85},
 ]
 
+# Region coordinates as arrays aligned with NSW_REGIONS, for batched API
+# requests; index both with the same positions to select a subset
+REGION_LAT = np.array([r["lat"] for r in NSW_REGIONS], dtype=np.float64)
+REGION_LON = np.array([r["lon"] for r in NSW_REGIONS], dtype=np.float64)
+
 # Open-Meteo API base URLs
 FORECAST_API_URL = "https://api.open-meteo.com/v1/forecast"
 HISTORICAL_API_URL = "https://archive-api.open-meteo.com/v1/archive"
@@ -53,3 +60,7 @@ THRESHOLDS = {
     "humidity": {"exact": 0, "near": 5, "wide": 10, "unit": "%"},
     "rain": {"exact": 0, "near": 1, "wide": 5, "unit": "mm"},
 }
+
+# Number of most recent days kept in the frontend summary.json
+# (the full record stays in data/results/history.jsonl.gz)
+SUMMARY_MAX_DAYS = 365
@@ -0,0 +1,109 @@
+"""
+Shared Open-Meteo client for both collection phases.
+Fetches every NSW region in a single multi-location request instead of one
+request per region.
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Optional, Union
+
+import msgspec
+import numpy as np
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import REGION_LAT, REGION_LON, FORECAST_API_URL, DAILY_VARIABLES, HOURLY_VARIABLES
+
+
+class Daily(msgspec.Struct):
+    """Daily arrays for one location, one entry per date in `time`."""
+    time: list[str]
+    temperature_2m_max: list[Optional[float]]
+    temperature_2m_min: list[Optional[float]]
+    precipitation_sum: list[Optional[float]]
+    wind_speed_10m_max: list[Optional[float]]
+
+
+class Hourly(msgspec.Struct):
+    """Hourly arrays for one location, one entry per local hour in `time`."""
+    time: list[str]
+    relative_humidity_2m: list[Optional[float]]
+
+
+class Location(msgspec.Struct):
+    """The parts of an Open-Meteo location result that we use; other fields
+    in the response are skipped without being decoded."""
+    daily: Daily
+    hourly: Hourly
+
+
+# A multi-location request returns a list; a single location a bare object
+_RESPONSE_DECODER = msgspec.json.Decoder(Union[list[Location], Location])
+
+
+def make_session():
+    """Build a Session that retries timeouts, connection errors and transient
+    HTTP statuses with exponential backoff."""
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+    )
+    adapter = HTTPAdapter(max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def fetch_regions(session, start_date, end_date, lats=REGION_LAT, lons=REGION_LON, timeout=30,
+                  **extra_params):
+    """Fetch daily/hourly data for all regions with one batched API call.
+
+    Open-Meteo accepts comma-separated coordinate lists and returns one result
+    per location, in the same order, so by default the payloads line up with
+    NSW_REGIONS.
+    """
+    params = {
+        "latitude": ",".join(map(str, lats)),
+        "longitude": ",".join(map(str, lons)),
+        "daily": ",".join(DAILY_VARIABLES),
+        "hourly": ",".join(HOURLY_VARIABLES),
+        "timezone": "Australia/Sydney",
+        "start_date": start_date,
+        "end_date": end_date,
+        "wind_speed_unit": "kmh",
+        "precipitation_unit": "mm",
+        "temperature_unit": "celsius",
+        **extra_params,
+    }
+
+    resp = session.get(FORECAST_API_URL, params=params, timeout=timeout)
+    resp.raise_for_status()
+    # Decode the raw bytes straight into typed structs
+    data = _RESPONSE_DECODER.decode(resp.content)
+    if isinstance(data, Location):
+        data = [data]
+    if len(data) != len(lats):
+        raise ValueError(f"Expected {len(lats)} locations in API response, got {len(data)}")
+    return data
+
+
+def daily_mean_humidity(hourly, target_date):
+    """Average the hourly relative humidity readings that fall on target_date.
+
+    Hourly timestamps are ordered local ISO strings ("YYYY-MM-DDTHH:MM"), so
+    the day's readings are one contiguous slice found by binary search. This
+    also copes with 23/25-hour days at daylight-saving transitions.
+    """
+    hourly_times = hourly.time
+    humidity_values = hourly.relative_humidity_2m
+    start = bisect_left(hourly_times, f"{target_date}T00:00")
+    end = bisect_right(hourly_times, f"{target_date}T23:59")
+
+    # Missing readings (None) become NaN and are dropped before the mean
+    day = np.array(humidity_values[start:end], dtype=float)
+    day = day[~np.isnan(day)]
+    return round(float(day.mean()), 1) if day.size else None